@@ -1,4 +1,5 @@
-from django.db.models.signals import post_delete, post_migrate
+from django.apps import apps
+from django.db.models.signals import post_delete, post_migrate, post_save
 from django.utils.translation import ugettext_lazy as _
 
 from mayan.apps.acls.classes import ModelPermission
@@ -43,8 +44,9 @@ from .events import (
     event_document_view
 )
 from .handlers import (
-    handler_create_default_document_type, handler_create_document_cache,
-    handler_remove_empty_duplicates_lists, handler_scan_duplicates_for
+    handler_clear_document_image_cache, handler_create_default_document_type,
+    handler_create_document_cache, handler_remove_empty_duplicates_lists,
+    handler_scan_duplicates_for
 )
 from .links.document_links import (
     link_document_clear_transformations, link_document_clone_transformations,
@@ -141,6 +143,8 @@ class DocumentsApp(MayanAppConfig):
         DocumentVersion = self.get_model(model_name='DocumentVersion')
         DuplicatedDocument = self.get_model(model_name='DuplicatedDocument')
 
+        Cache = apps.get_model(app_label='file_caching', model_name='Cache')
+
         DynamicSerializerField.add_serializer(
             klass=Document,
             serializer_class='mayan.apps.documents.serializers.DocumentSerializer'
@@ -580,6 +584,10 @@ class DocumentsApp(MayanAppConfig):
             ), sources=(DocumentVersion,)
         )
 
+        post_delete.connect(
+            dispatch_uid='documents_handler_clear_document_image_cache_delete',
+            receiver=handler_clear_document_image_cache, sender=Cache
+        )
         post_delete.connect(
             dispatch_uid='documents_handler_remove_empty_duplicates_lists',
             receiver=handler_remove_empty_duplicates_lists,
@@ -593,6 +601,10 @@ class DocumentsApp(MayanAppConfig):
             dispatch_uid='documents_handler_create_document_cache',
             receiver=handler_create_document_cache,
         )
+        post_save.connect(
+            dispatch_uid='documents_handler_clear_document_image_cache_save',
+            receiver=handler_clear_document_image_cache, sender=Cache
+        )
         post_version_upload.connect(
             dispatch_uid='documents_handler_scan_duplicates_for',
             receiver=handler_scan_duplicates_for
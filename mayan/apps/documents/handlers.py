@@ -6,6 +6,11 @@ from .literals import (
 from .settings import setting_document_cache_maximum_size
 from .signals import post_initial_document_type
 from .tasks import task_clean_empty_duplicate_lists, task_scan_duplicates_for
+from .utils import clear_document_image_cache
+
+
+def handler_clear_document_image_cache(sender, **kwargs):
+    clear_document_image_cache()
 
 
 def handler_create_default_document_type(sender, **kwargs):
@@ -9,7 +9,7 @@ DEFAULT_DELETE_PERIOD = 30
 DEFAULT_DELETE_TIME_UNIT = TIME_DELTA_UNIT_DAYS
 DEFAULT_DOCUMENT_TYPE_LABEL = _('Default')
 DEFAULT_DOCUMENTS_CACHE_MAXIMUM_SIZE = 500 * 2 ** 20  # 500 Megabytes
-DEFAULT_DOCUMENTS_HASH_BLOCK_SIZE = 65535
+DEFAULT_DOCUMENTS_HASH_BLOCK_SIZE = 2 ** 20  # 1 Megabyte
 DEFAULT_LANGUAGE = 'eng'
 DEFAULT_LANGUAGE_CODES = (
     'ilo', 'run', 'uig', 'hin', 'pan', 'pnb', 'wuu', 'msa', 'kxd', 'ind',
@@ -30,9 +30,16 @@ DEFAULT_LANGUAGE_CODES = (
 DEFAULT_STUB_EXPIRATION_INTERVAL = 60 * 60 * 24  # 24 hours
 DEFAULT_ZIP_FILENAME = 'document_bundle.zip'
 DOCUMENT_IMAGE_TASK_TIMEOUT = 120
+DOCUMENT_PAGE_BULK_CREATE_BATCH_SIZE = 500
+FILE_COPY_BUFFER_SIZE = 2 ** 20  # 1 Megabyte
 UPDATE_PAGE_COUNT_RETRY_DELAY = 10
 UPLOAD_NEW_VERSION_RETRY_DELAY = 10
 
+DOCUMENT_VERSION_QUERYSET_STRATEGY_NONE = 'none'
+DOCUMENT_VERSION_QUERYSET_STRATEGY_PREFETCH_RELATED = 'prefetch_related'
+DOCUMENT_VERSION_QUERYSET_STRATEGY_SELECT_RELATED = 'select_related'
+DEFAULT_DOCUMENT_VERSION_QUERYSET_STRATEGY = DOCUMENT_VERSION_QUERYSET_STRATEGY_SELECT_RELATED
+
 PAGE_RANGE_ALL = 'all'
 PAGE_RANGE_RANGE = 'range'
 PAGE_RANGE_CHOICES = (
@@ -4,13 +4,18 @@ import logging
 from django.apps import apps
 from django.contrib.auth import get_user_model
 from django.db import models
-from django.db.models import F, Max
+from django.db.models import F, Max, Prefetch
 from django.utils.encoding import force_text
 from django.utils.timezone import now
 
+from .literals import (
+    DOCUMENT_VERSION_QUERYSET_STRATEGY_NONE,
+    DOCUMENT_VERSION_QUERYSET_STRATEGY_PREFETCH_RELATED,
+    DOCUMENT_VERSION_QUERYSET_STRATEGY_SELECT_RELATED
+)
 from .settings import (
-    setting_favorite_count, setting_recent_access_count,
-    setting_stub_expiration_interval
+    setting_document_version_queryset_strategy, setting_favorite_count,
+    setting_recent_access_count, setting_stub_expiration_interval
 )
 
 logger = logging.getLogger(name=__name__)
@@ -123,6 +128,40 @@ class DocumentVersionManager(models.Manager):
 
         return self.get(document__pk=document.pk, checksum=checksum)
 
+    def get_queryset(self):
+        queryset = super(DocumentVersionManager, self).get_queryset()
+        strategy = setting_document_version_queryset_strategy.value
+
+        if strategy not in (
+            DOCUMENT_VERSION_QUERYSET_STRATEGY_NONE,
+            DOCUMENT_VERSION_QUERYSET_STRATEGY_PREFETCH_RELATED,
+            DOCUMENT_VERSION_QUERYSET_STRATEGY_SELECT_RELATED
+        ):
+            logger.warning(
+                'Unknown document version queryset strategy "%s"; related '
+                'objects will not be loaded.', strategy
+            )
+
+        if strategy in (
+            DOCUMENT_VERSION_QUERYSET_STRATEGY_PREFETCH_RELATED,
+            DOCUMENT_VERSION_QUERYSET_STRATEGY_SELECT_RELATED
+        ):
+            queryset = queryset.select_related('document')
+
+        if strategy == DOCUMENT_VERSION_QUERYSET_STRATEGY_PREFETCH_RELATED:
+            DocumentPage = apps.get_model(
+                app_label='documents', model_name='DocumentPage'
+            )
+            queryset = queryset.prefetch_related(
+                Prefetch(
+                    lookup='version_pages',
+                    queryset=DocumentPage.objects.order_by('page_number'),
+                    to_attr='_prefetched_pages'
+                )
+            )
+
+        return queryset
+
 
 class DuplicatedDocumentManager(models.Manager):
     def clean_empty_duplicate_lists(self):
@@ -0,0 +1,51 @@
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def operation_update_page_count(apps, schema_editor):
+    DocumentPage = apps.get_model(
+        app_label='documents', model_name='DocumentPage'
+    )
+    DocumentVersion = apps.get_model(
+        app_label='documents', model_name='DocumentVersion'
+    )
+
+    page_count_queryset = DocumentPage.objects.using(
+        schema_editor.connection.alias
+    ).filter(
+        document_version=OuterRef('pk'), enabled=True
+    ).order_by().values('document_version').annotate(
+        page_count=Count('pk')
+    ).values('page_count')
+
+    DocumentVersion.objects.using(schema_editor.connection.alias).update(
+        page_count=Coalesce(
+            Subquery(
+                queryset=page_count_queryset,
+                output_field=models.PositiveIntegerField()
+            ), 0
+        )
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('documents', '0054_trasheddocument'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='documentversion',
+            name='page_count',
+            field=models.PositiveIntegerField(
+                default=0, editable=False,
+                help_text='The number of enabled pages of the document '
+                'version.', verbose_name='Page count'
+            ),
+        ),
+        migrations.RunPython(
+            code=operation_update_page_count,
+            reverse_code=migrations.RunPython.noop
+        ),
+    ]
@@ -0,0 +1,73 @@
+import uuid
+
+from django.db import migrations, models
+
+from ..literals import STORAGE_NAME_DOCUMENT_IMAGE
+from ..storages import storage_document_image_cache
+
+
+def operation_purge_document_image_cache(apps, schema_editor):
+    # The cache partition names of the document versions and pages are
+    # derived from the document version UUID. Purge the existing
+    # partitions since their names no longer match.
+    CachePartition = apps.get_model(
+        app_label='file_caching', model_name='CachePartition'
+    )
+    CachePartitionFile = apps.get_model(
+        app_label='file_caching', model_name='CachePartitionFile'
+    )
+
+    cache_partitions = CachePartition.objects.using(
+        schema_editor.connection.alias
+    ).filter(cache__defined_storage_name=STORAGE_NAME_DOCUMENT_IMAGE)
+
+    if cache_partitions.exists():
+        storage = storage_document_image_cache.get_storage_instance()
+
+        for cache_partition_file in CachePartitionFile.objects.using(schema_editor.connection.alias).filter(partition__in=cache_partitions):
+            storage.delete(
+                name='{}-{}'.format(
+                    cache_partition_file.partition.name,
+                    cache_partition_file.filename
+                )
+            )
+
+        cache_partitions.delete()
+
+
+def operation_update_uuid(apps, schema_editor):
+    DocumentVersion = apps.get_model(
+        app_label='documents', model_name='DocumentVersion'
+    )
+
+    for document_version in DocumentVersion.objects.using(schema_editor.connection.alias).all():
+        document_version.uuid = uuid.uuid4()
+        document_version.save(update_fields=('uuid',))
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('documents', '0055_documentversion_page_count'),
+        ('file_caching', '0006_auto_20200322_0626'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='documentversion',
+            name='uuid',
+            field=models.UUIDField(
+                default=uuid.uuid4, editable=False,
+                help_text='UUID of a document version, universally Unique '
+                'ID. An unique identifier generated for each document '
+                'version.', verbose_name='UUID'
+            ),
+        ),
+        migrations.RunPython(
+            code=operation_update_uuid,
+            reverse_code=migrations.RunPython.noop
+        ),
+        migrations.RunPython(
+            code=operation_purge_document_image_cache,
+            reverse_code=migrations.RunPython.noop
+        ),
+    ]
@@ -0,0 +1,22 @@
+import uuid
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('documents', '0056_documentversion_uuid'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='documentversion',
+            name='uuid',
+            field=models.UUIDField(
+                default=uuid.uuid4, editable=False,
+                help_text='UUID of a document version, universally Unique '
+                'ID. An unique identifier generated for each document '
+                'version.', unique=True, verbose_name='UUID'
+            ),
+        ),
+    ]
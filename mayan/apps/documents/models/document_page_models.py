@@ -48,6 +48,10 @@ class DocumentPage(models.Model):
     objects = DocumentPageManager()
     passthrough = models.Manager()
 
+    # Value of the enabled field as last loaded from or saved to the
+    # database.
+    _enabled_stored = None
+
     class Meta:
         ordering = ('page_number',)
         verbose_name = _('Document page')
@@ -56,6 +60,14 @@ class DocumentPage(models.Model):
     def __str__(self):
         return self.get_label()
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super(DocumentPage, cls).from_db(
+            db=db, field_names=field_names, values=values
+        )
+        instance._enabled_stored = instance.__dict__.get('enabled')
+        return instance
+
     @cached_property
     def cache_partition(self):
         partition, created = self.document_version.cache.partitions.get_or_create(
@@ -66,6 +78,7 @@ class DocumentPage(models.Model):
     def delete(self, *args, **kwargs):
         self.cache_partition.delete()
         super(DocumentPage, self).delete(*args, **kwargs)
+        self.document_version.refresh_page_count()
 
     def detect_orientation(self):
         with self.document_version.open() as file_object:
@@ -259,6 +272,27 @@ class DocumentPage(models.Model):
         return (self.page_number, self.document_version.natural_key())
     natural_key.dependencies = ['documents.DocumentVersion']
 
+    def save(self, *args, **kwargs):
+        new_document_page = not self.pk
+        update_fields = kwargs.get('update_fields')
+
+        enabled_changed = self.enabled != self._enabled_stored
+        if update_fields is not None and 'enabled' not in update_fields:
+            enabled_changed = False
+
+        result = super(DocumentPage, self).save(*args, **kwargs)
+
+        if not update_fields or 'enabled' in update_fields:
+            self._enabled_stored = self.enabled
+
+        if not new_document_page and enabled_changed:
+            # Enabling or disabling a page changes the page count of the
+            # document version. New pages are accounted for by
+            # DocumentVersion.update_page_count.
+            self.document_version.refresh_page_count()
+
+        return result
+
     @property
     def siblings(self):
         return DocumentPage.objects.filter(
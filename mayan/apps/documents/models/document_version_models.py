@@ -1,3 +1,4 @@
+from functools import lru_cache
 import hashlib
 import logging
 import os
@@ -5,6 +6,7 @@ import shutil
 import uuid
 
 from django.apps import apps
+from django.core.files import File
 from django.db import models, transaction
 from django.urls import reverse
 from django.utils.encoding import force_text, python_2_unicode_compatible
@@ -18,15 +20,18 @@ from mayan.apps.converter.transformations import TransformationRotate
 from mayan.apps.converter.utils import get_converter_class
 from mayan.apps.mimetype.api import get_mimetype
 from mayan.apps.storage.classes import DefinedStorageLazy
+from mayan.apps.storage.utils import NamedTemporaryFile
 from mayan.apps.templating.classes import Template
 
 from ..events import event_document_version_new, event_document_version_revert
 from ..literals import (
-    STORAGE_NAME_DOCUMENT_IMAGE, STORAGE_NAME_DOCUMENT_VERSION
+    DOCUMENT_PAGE_BULK_CREATE_BATCH_SIZE, FILE_COPY_BUFFER_SIZE,
+    STORAGE_NAME_DOCUMENT_VERSION
 )
 from ..managers import DocumentVersionManager
 from ..settings import setting_fix_orientation, setting_hash_block_size
 from ..signals import post_document_created, post_version_upload
+from ..utils import get_document_image_cache
 
 from .document_models import Document
 
@@ -43,6 +48,12 @@ def UUID_FUNCTION(*args, **kwargs):
     return force_text(uuid.uuid4())
 
 
+@lru_cache(maxsize=None)
+def get_template(template_string):
+    # Compile each template string only once per process.
+    return Template(template_string=template_string)
+
+
 @python_2_unicode_compatible
 class DocumentVersion(models.Model):
     """
@@ -59,16 +70,26 @@ class DocumentVersion(models.Model):
     binary data. Only identical documents will have the same checksum. If a
     document is modified after upload it's checksum will not match, used for
     detecting file tampering among other things.
+    * uuid - UUID of a document version. An unique identifier generated for
+    each document version, used to name the cache partitions of the version
+    and its pages.
     """
     _hooks_pre_create = []
     _pre_open_hooks = []
     _pre_save_hooks = []
     _post_save_hooks = []
+    _exists_cache = None
 
     document = models.ForeignKey(
         on_delete=models.CASCADE, related_name='versions', to=Document,
         verbose_name=_('Document')
     )
+    uuid = models.UUIDField(
+        default=uuid.uuid4, editable=False, help_text=_(
+            'UUID of a document version, universally Unique ID. An unique '
+            'identifier generated for each document version.'
+        ), unique=True, verbose_name=_('UUID')
+    )
     timestamp = models.DateTimeField(
         auto_now_add=True, db_index=True, help_text=_(
             'The server date and time when the document version was processed.'
@@ -105,6 +126,11 @@ class DocumentVersion(models.Model):
             'checksum.'
         ), max_length=64, null=True, verbose_name=_('Checksum')
     )
+    page_count = models.PositiveIntegerField(
+        default=0, editable=False, help_text=_(
+            'The number of enabled pages of the document version.'
+        ), verbose_name=_('Page count')
+    )
 
     class Meta:
         ordering = ('timestamp',)
@@ -166,13 +192,47 @@ class DocumentVersion(models.Model):
     def __str__(self):
         return self.get_rendered_string()
 
-    @cached_property
-    def cache(self):
-        Cache = apps.get_model(app_label='file_caching', model_name='Cache')
-        return Cache.objects.get(
-            defined_storage_name=STORAGE_NAME_DOCUMENT_IMAGE
+    @staticmethod
+    def _is_local_file_object(file_object):
+        """
+        Return True if the file object is backed by a local file that can
+        be read again after being saved to the storage backend.
+        """
+        try:
+            file_object.fileno()
+            return file_object.seekable()
+        except (AttributeError, OSError, ValueError):
+            return False
+
+    def _execute_pre_open_hooks(self, file_object):
+        result = DocumentVersion._execute_hooks(
+            hook_list=DocumentVersion._pre_open_hooks,
+            instance=self, file_object=file_object
         )
 
+        return result['file_object']
+
+    def _calculate_checksum(self, block_size, file_object):
+        hash_object = hash_function()
+        while (True):
+            data = file_object.read(block_size)
+            if not data:
+                break
+
+            hash_object.update(data)
+
+        return force_text(hash_object.hexdigest())
+
+    def _calculate_page_count(self, file_object):
+        converter = get_converter_class()(
+            file_object=file_object, mime_type=self.mimetype
+        )
+        return converter.get_page_count()
+
+    @property
+    def cache(self):
+        return get_document_image_cache()
+
     @cached_property
     def cache_partition(self):
         partition, created = self.cache.partitions.get_or_create(
@@ -181,10 +241,18 @@ class DocumentVersion(models.Model):
         return partition
 
     def delete(self, *args, **kwargs):
-        for page in self.pages.all():
-            page.delete()
+        # Purge the cache partitions of the pages and delete the pages in
+        # bulk instead of calling each page's delete method.
+        page_cache_partitions = self.cache.partitions.filter(
+            name__startswith='{}-'.format(self.uuid)
+        )
+        for partition in page_cache_partitions:
+            partition.delete()
+
+        self.pages_all.delete()
 
         self.file.storage.delete(self.file.name)
+        self._exists_cache = None
         self.cache_partition.delete()
 
         return super(DocumentVersion, self).delete(*args, **kwargs)
@@ -205,12 +273,38 @@ class DocumentVersion(models.Model):
         exists in storage. Returns True if the document's file is verified to
         be in the document storage. This is a diagnostic flag to help users
         detect if the storage has desynchronized (ie: Amazon's S3).
+        The result is remembered for the lifetime of the instance to avoid
+        repeated requests to remote storages, as long as the file name does
+        not change.
+        """
+        if self._exists_cache is None or self._exists_cache[0] != self.file.name:
+            self._exists_cache = (
+                self.file.name, self.file.storage.exists(self.file.name)
+            )
+
+        return self._exists_cache[1]
+
+    def fix_orientation(self, file_object=None):
         """
-        return self.file.storage.exists(self.file.name)
+        Detect the orientation of each page and add a rotation
+        transformation to the pages that are not upright. An already opened
+        file object can be passed to avoid opening the file again.
+        """
+        if file_object is None:
+            with self.open() as file_object:
+                return self.fix_orientation(file_object=file_object)
+
+        # Use a single converter instance for all the pages instead of
+        # opening the file once per page.
+        file_object.seek(0)
+        converter = get_converter_class()(
+            file_object=file_object, mime_type=self.mimetype
+        )
 
-    def fix_orientation(self):
         for page in self.pages.all():
-            degrees = page.detect_orientation()
+            degrees = converter.detect_orientation(
+                page_number=page.page_number
+            )
             if degrees:
                 layer_saved_transformations.add_transformation_to(
                     obj=page, transformation_class=TransformationRotate,
@@ -225,7 +319,13 @@ class DocumentVersion(models.Model):
         )
 
     def get_api_image_url(self, *args, **kwargs):
-        first_page = self.pages.first()
+        # Use the pages loaded by the manager when available.
+        prefetched_pages = getattr(self, '_prefetched_pages', None)
+        if prefetched_pages is None:
+            first_page = self.pages.first()
+        else:
+            first_page = next(iter(prefetched_pages), None)
+
         if first_page:
             return first_page.get_api_image_url(*args, **kwargs)
 
@@ -246,10 +346,18 @@ class DocumentVersion(models.Model):
                     with converter.to_pdf() as pdf_file_object:
                         with self.cache_partition.create_file(filename=cache_filename) as file_object:
                             shutil.copyfileobj(
-                                fsrc=pdf_file_object, fdst=file_object
+                                fsrc=pdf_file_object, fdst=file_object,
+                                length=FILE_COPY_BUFFER_SIZE
                             )
 
-                        return self.cache_partition.get_file(filename=cache_filename).open()
+                        # Open the file just created directly from the
+                        # cache storage to avoid querying for the cache
+                        # partition file again.
+                        return self.cache.storage.open(
+                            name=self.cache_partition.get_full_filename(
+                                filename=cache_filename
+                            )
+                        )
             except InvalidOfficeFormat:
                 return self.open()
             except Exception as exception:
@@ -269,12 +377,12 @@ class DocumentVersion(models.Model):
                 filename, self.get_rendered_timestamp(), extension
             )
         else:
-            return Template(
+            return get_template(
                 template_string='{{ instance.document }} - {{ instance.timestamp }}'
             ).render(context={'instance': self})
 
     def get_rendered_timestamp(self):
-        return Template(
+        return get_template(
             template_string='{{ instance.timestamp }}'
         ).render(
             context={'instance': self}
@@ -296,15 +404,10 @@ class DocumentVersion(models.Model):
         if raw:
             return self.file.storage.open(name=self.file.name)
         else:
-            file_object = self.file.storage.open(name=self.file.name)
-
-            result = DocumentVersion._execute_hooks(
-                hook_list=DocumentVersion._pre_open_hooks,
-                instance=self, file_object=file_object
+            return self._execute_pre_open_hooks(
+                file_object=self.file.storage.open(name=self.file.name)
             )
 
-            return result['file_object']
-
     @property
     def pages_all(self):
         DocumentPage = apps.get_model(
@@ -312,17 +415,18 @@ class DocumentVersion(models.Model):
         )
         return DocumentPage.passthrough.filter(document_version=self)
 
-    @property
-    def page_count(self):
-        """
-        The number of pages that the document posses.
-        """
-        return self.pages.count()
-
     @property
     def pages(self):
         return self.version_pages.all()
 
+    def refresh_page_count(self):
+        """
+        Update the stored page count from the enabled pages of the
+        document version.
+        """
+        self.page_count = self.pages.count()
+        super(DocumentVersion, self).save(update_fields=('page_count',))
+
     def revert(self, _user=None):
         """
         Delete the subsequent versions after this one
@@ -347,6 +451,9 @@ class DocumentVersion(models.Model):
         user = kwargs.pop('_user', None)
         new_document_version = not self.pk
 
+        local_file_object = None
+        staged_file_object = None
+
         if new_document_version:
             logger.info('Creating new version for document: %s', self.document)
 
@@ -358,6 +465,24 @@ class DocumentVersion(models.Model):
                     instance=self, sender=DocumentVersion, user=user
                 )
 
+                if new_document_version and not self.file._committed:
+                    # Keep the new file at hand to calculate the checksum,
+                    # mimetype, and page count without reading the file
+                    # back from the storage backend. Post save hooks, like
+                    # the embedded signature hook, still open the stored
+                    # file themselves. Files that are not local or
+                    # seekable are staged in a local temporary file first.
+                    if DocumentVersion._is_local_file_object(file_object=self.file.file):
+                        local_file_object = self.file.file
+                    else:
+                        staged_file_object = NamedTemporaryFile()
+                        for chunk in self.file.chunks(chunk_size=FILE_COPY_BUFFER_SIZE):
+                            staged_file_object.write(chunk)
+
+                        staged_file_object.seek(0)
+                        local_file_object = staged_file_object
+                        self.file = File(file=staged_file_object)
+
                 super(DocumentVersion, self).save(*args, **kwargs)
 
                 DocumentVersion._execute_hooks(
@@ -366,13 +491,41 @@ class DocumentVersion(models.Model):
                 )
 
                 if new_document_version:
-                    # Only do this for new documents
-                    self.update_checksum(save=False)
-                    self.update_mimetype(save=False)
-                    self.save()
-                    self.update_page_count(save=False)
-                    if setting_fix_orientation.value:
-                        self.fix_orientation()
+                    # Only do this for new documents. Open the file once
+                    # and share it among all the update methods to avoid
+                    # multiple reads from the storage backend.
+                    if local_file_object is None:
+                        file_object = self.open()
+                    else:
+                        local_file_object.seek(0)
+                        file_object = self._execute_pre_open_hooks(
+                            file_object=local_file_object
+                        )
+
+                    try:
+                        self.update_checksum(
+                            file_object=file_object, save=False
+                        )
+                        self.update_mimetype(
+                            file_object=file_object, save=False
+                        )
+                        self.update_page_count(
+                            file_object=file_object, save=False
+                        )
+
+                        if setting_fix_orientation.value:
+                            self.fix_orientation(file_object=file_object)
+                    finally:
+                        # Leave the file object of the caller open, it is
+                        # closed by the caller.
+                        if staged_file_object is not None or file_object is not local_file_object:
+                            file_object.close()
+
+                    super(DocumentVersion, self).save(
+                        update_fields=(
+                            'checksum', 'encoding', 'mimetype', 'page_count'
+                        )
+                    )
 
                     logger.info(
                         'New document version "%s" created for document: %s',
@@ -397,10 +550,13 @@ class DocumentVersion(models.Model):
                 )
                 post_version_upload.send(sender=DocumentVersion, instance=self)
 
-                if tuple(self.document.versions.all()) == (self,):
+                if not self.document.versions.exclude(pk=self.pk).exists():
                     post_document_created.send(
                         instance=self.document, sender=Document
                     )
+        finally:
+            if staged_file_object is not None:
+                staged_file_object.close()
 
     def save_to_file(self, file_object):
         """
@@ -408,7 +564,10 @@ class DocumentVersion(models.Model):
         to the local filesystem
         """
         with self.open() as input_file_object:
-            shutil.copyfileobj(fsrc=input_file_object, fdst=file_object)
+            shutil.copyfileobj(
+                fsrc=input_file_object, fdst=file_object,
+                length=FILE_COPY_BUFFER_SIZE
+            )
 
     @property
     def size(self):
@@ -417,10 +576,11 @@ class DocumentVersion(models.Model):
         else:
             return None
 
-    def update_checksum(self, save=True):
+    def update_checksum(self, save=True, file_object=None):
         """
         Open a document version's file and update the checksum field using
-        the user provided checksum function
+        the user provided checksum function. An already opened file object
+        can be passed to avoid opening the file again.
         """
         block_size = setting_hash_block_size.value
         if block_size == 0:
@@ -430,33 +590,41 @@ class DocumentVersion(models.Model):
             # https://docs.python.org/2/tutorial/inputoutput.html#methods-of-file-objects
             block_size = -1
 
-        if self.exists():
-            hash_object = hash_function()
+        if file_object is not None:
+            file_object.seek(0)
+            self.checksum = self._calculate_checksum(
+                block_size=block_size, file_object=file_object
+            )
+        elif self.exists():
             with self.open() as file_object:
-                while (True):
-                    data = file_object.read(block_size)
-                    if not data:
-                        break
-
-                    hash_object.update(data)
+                self.checksum = self._calculate_checksum(
+                    block_size=block_size, file_object=file_object
+                )
+        else:
+            return
 
-            self.checksum = force_text(hash_object.hexdigest())
-            if save:
-                self.save()
+        if save:
+            self.save()
 
-            return self.checksum
+        return self.checksum
 
-    def update_mimetype(self, save=True):
+    def update_mimetype(self, save=True, file_object=None):
         """
         Read a document verions's file and determine the mimetype by calling
-        the get_mimetype wrapper
+        the get_mimetype wrapper. An already opened file object can be passed
+        to avoid opening the file again.
         """
-        if self.exists():
+        if file_object is not None or self.exists():
             try:
-                with self.open() as file_object:
+                if file_object is not None:
                     self.mimetype, self.encoding = get_mimetype(
                         file_object=file_object
                     )
+                else:
+                    with self.open() as file_object:
+                        self.mimetype, self.encoding = get_mimetype(
+                            file_object=file_object
+                        )
             except Exception:
                 self.mimetype = ''
                 self.encoding = ''
@@ -464,13 +632,18 @@ class DocumentVersion(models.Model):
                 if save:
                     self.save()
 
-    def update_page_count(self, save=True):
+    def update_page_count(self, save=True, file_object=None):
         try:
-            with self.open() as file_object:
-                converter = get_converter_class()(
-                    file_object=file_object, mime_type=self.mimetype
+            if file_object is not None:
+                file_object.seek(0)
+                detected_pages = self._calculate_page_count(
+                    file_object=file_object
                 )
-                detected_pages = converter.get_page_count()
+            else:
+                with self.open() as file_object:
+                    detected_pages = self._calculate_page_count(
+                        file_object=file_object
+                    )
         except PageCountError:
             # If converter backend doesn't understand the format,
             # use 1 as the total page count
@@ -483,17 +656,17 @@ class DocumentVersion(models.Model):
             with transaction.atomic():
                 self.pages.all().delete()
 
-                for page_number in range(detected_pages):
-                    DocumentPage.objects.create(
-                        document_version=self, page_number=page_number + 1
-                    )
+                DocumentPage.objects.bulk_create(
+                    batch_size=DOCUMENT_PAGE_BULK_CREATE_BATCH_SIZE, objs=[
+                        DocumentPage(
+                            document_version=self, page_number=page_number + 1
+                        ) for page_number in range(detected_pages)
+                    ]
+                )
+
+                self.page_count = detected_pages
 
             if save:
                 self.save()
 
             return detected_pages
-
-    @property
-    def uuid(self):
-        # Make cache UUID a mix of document UUID, version ID
-        return '{}-{}'.format(self.document.uuid, self.pk)
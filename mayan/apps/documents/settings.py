@@ -6,6 +6,7 @@ from django.utils.translation import ugettext_lazy as _
 from mayan.apps.smart_settings.classes import Namespace
 
 from .literals import (
+    DEFAULT_DOCUMENT_VERSION_QUERYSET_STRATEGY,
     DEFAULT_DOCUMENTS_CACHE_MAXIMUM_SIZE, DEFAULT_DOCUMENTS_HASH_BLOCK_SIZE,
     DEFAULT_LANGUAGE, DEFAULT_LANGUAGE_CODES,
     DEFAULT_STUB_EXPIRATION_INTERVAL
@@ -167,6 +168,15 @@ setting_list_thumbnail_width = namespace.add_setting(
         'view mode.'
     )
 )
+setting_document_version_queryset_strategy = namespace.add_setting(
+    global_name='DOCUMENTS_VERSION_QUERYSET_STRATEGY',
+    default=DEFAULT_DOCUMENT_VERSION_QUERYSET_STRATEGY, help_text=_(
+        'Strategy used to load the related objects of the document versions '
+        'in a single query. Options: "select_related" loads the documents, '
+        '"prefetch_related" also loads the pages, and "none" disables the '
+        'loading of related objects.'
+    )
+)
 setting_zoom_max_level = namespace.add_setting(
     global_name='DOCUMENTS_ZOOM_MAX_LEVEL', default=300,
     help_text=_(
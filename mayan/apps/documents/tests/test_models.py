@@ -1,13 +1,19 @@
 from datetime import timedelta
 import time
 
+import mock
+
+from django.db import connection
 from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
 
 from mayan.apps.common.tests.base import BaseTestCase
 from mayan.apps.converter.layers import layer_saved_transformations
+from mayan.apps.file_caching.models import CachePartition
 
 from ..models import (
-    DeletedDocument, Document, DocumentType, DuplicatedDocument
+    DeletedDocument, Document, DocumentPage, DocumentType, DocumentVersion,
+    DuplicatedDocument
 )
 from ..settings import setting_stub_expiration_interval
 
@@ -205,6 +211,89 @@ class DocumentVersionTestCase(GenericDocumentTestCase):
             TEST_SMALL_DOCUMENT_CHECKSUM
         )
 
+    def test_cache_partition_names(self):
+        test_document_version = self.test_document.latest_version
+        test_document_page = test_document_version.pages.first()
+
+        self.assertEqual(
+            test_document_version.cache_partition.name,
+            'version-{}'.format(test_document_version.uuid)
+        )
+        self.assertEqual(
+            test_document_page.cache_partition.name, '{}-{}'.format(
+                test_document_version.uuid, test_document_page.pk
+            )
+        )
+
+    def test_delete_version_page_cache_partitions(self):
+        with open(TEST_SMALL_DOCUMENT_PATH, mode='rb') as file_object:
+            self.test_document.new_version(
+                file_object=file_object
+            )
+
+        test_document_version = self.test_document.latest_version
+        test_document_page = test_document_version.pages.first()
+        test_cache_partition_name = test_document_page.cache_partition.name
+
+        test_document_version.delete()
+
+        self.assertFalse(
+            CachePartition.objects.filter(
+                name=test_cache_partition_name
+            ).exists()
+        )
+        self.assertEqual(self.test_document.versions.count(), 1)
+
+    def test_method_exists_cache(self):
+        test_document_version = self.test_document.latest_version
+        self.assertTrue(test_document_version.exists())
+
+        test_document_version.file.storage.delete(
+            test_document_version.file.name
+        )
+        self.assertTrue(test_document_version.exists())
+        self.assertFalse(self.test_document.latest_version.exists())
+
+    @mock.patch(
+        'mayan.apps.documents.models.document_version_models.post_version_upload'
+    )
+    def test_new_version_storage_file_not_reopened(
+        self, mock_post_version_upload
+    ):
+        # Only covers the checksum, mimetype, and page count updates of
+        # DocumentVersion.save(). The post save hooks and the post upload
+        # handlers of other apps are excluded as they open the stored file
+        # by themselves; with the document signatures app installed, the
+        # embedded signature hook still reads the stored file once per
+        # new version.
+        with mock.patch.object(DocumentVersion, '_post_save_hooks', new=[]):
+            with mock.patch.object(DocumentVersion, 'open') as mock_open:
+                with open(TEST_SMALL_DOCUMENT_PATH, mode='rb') as file_object:
+                    test_document_version = self.test_document.new_version(
+                        file_object=file_object
+                    )
+
+        self.assertFalse(mock_open.called)
+        self.assertEqual(
+            test_document_version.checksum, TEST_SMALL_DOCUMENT_CHECKSUM
+        )
+        self.assertEqual(
+            test_document_version.mimetype, TEST_SMALL_DOCUMENT_MIMETYPE
+        )
+
+    def test_page_count_after_page_disable(self):
+        test_document_page = self.test_document.latest_version.pages.first()
+        test_document_page.enabled = False
+        test_document_page.save()
+
+        self.assertEqual(self.test_document.latest_version.page_count, 0)
+
+    def test_page_count_after_page_delete(self):
+        test_document_page = self.test_document.latest_version.pages.first()
+        test_document_page.delete()
+
+        self.assertEqual(self.test_document.latest_version.page_count, 0)
+
     def test_revert_version(self):
         self.assertEqual(self.test_document.versions.count(), 1)
 
@@ -229,6 +318,58 @@ class DocumentVersionTestCase(GenericDocumentTestCase):
         self.assertTrue(self.test_document.latest_version.get_absolute_url())
 
 
+@override_settings(DOCUMENTS_HASH_BLOCK_SIZE=1)
+class DocumentVersionSmallHashBlockSizeTestCase(GenericDocumentTestCase):
+    def test_document_version_checksum(self):
+        self.assertEqual(
+            self.test_document.checksum, TEST_SMALL_DOCUMENT_CHECKSUM
+        )
+
+
+@override_settings(DOCUMENTS_HASH_BLOCK_SIZE=0)
+class DocumentVersionNoHashBlockSizeTestCase(GenericDocumentTestCase):
+    def test_document_version_checksum(self):
+        self.assertEqual(
+            self.test_document.checksum, TEST_SMALL_DOCUMENT_CHECKSUM
+        )
+
+
+@override_settings(DOCUMENTS_VERSION_QUERYSET_STRATEGY='prefetch_related')
+class DocumentVersionPrefetchRelatedTestCase(GenericDocumentTestCase):
+    def test_document_version_document_access(self):
+        test_document_version = DocumentVersion.objects.get(
+            pk=self.test_document.latest_version.pk
+        )
+
+        with self.assertNumQueries(num=0):
+            self.assertEqual(
+                test_document_version.document.pk, self.test_document.pk
+            )
+
+    def test_document_version_get_api_image_url(self):
+        test_document_page = DocumentPage.objects.select_related(
+            'document_version__document'
+        ).get(pk=self.test_document.latest_version.pages.first().pk)
+
+        # Call twice to measure only the queries of the page itself once
+        # any per process caches are populated.
+        test_document_page.get_api_image_url()
+        with CaptureQueriesContext(connection=connection) as queries:
+            test_document_page_url = test_document_page.get_api_image_url()
+
+        test_document_version = DocumentVersion.objects.get(
+            pk=self.test_document.latest_version.pk
+        )
+
+        # The first page is taken from the prefetched pages instead of
+        # being queried.
+        with self.assertNumQueries(num=len(queries.captured_queries)):
+            self.assertEqual(
+                test_document_version.get_api_image_url(),
+                test_document_page_url
+            )
+
+
 class DocumentManagerTestCase(BaseTestCase):
     def setUp(self):
         super(DocumentManagerTestCase, self).setUp()
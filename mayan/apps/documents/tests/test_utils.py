@@ -1,9 +1,33 @@
 from mayan.apps.common.tests.base import BaseTestCase
 
-from ..utils import parse_range
+from ..utils import (
+    clear_document_image_cache, get_document_image_cache, parse_range
+)
 
 
 class DocumentUtilsTestCase(BaseTestCase):
+    def setUp(self):
+        super(DocumentUtilsTestCase, self).setUp()
+        # Don't leak the instances of these tests, which can hold values
+        # rolled back with the test transaction.
+        self.addCleanup(clear_document_image_cache)
+
+    def test_get_document_image_cache(self):
+        cache = get_document_image_cache()
+
+        with self.assertNumQueries(num=0):
+            self.assertEqual(get_document_image_cache(), cache)
+
+    def test_get_document_image_cache_after_save(self):
+        cache = get_document_image_cache()
+        cache.maximum_size = cache.maximum_size + 1
+        cache.save()
+
+        self.assertFalse(get_document_image_cache() is cache)
+        self.assertEqual(
+            get_document_image_cache().maximum_size, cache.maximum_size
+        )
+
     def test_parse_range(self):
         self.assertEqual(
             parse_range('1'), [1]
@@ -2,12 +2,40 @@ import logging
 
 import pycountry
 
+from django.apps import apps
 from django.utils.translation import ugettext_lazy as _
 
+from .literals import STORAGE_NAME_DOCUMENT_IMAGE
 from .settings import setting_language_codes
 
 logger = logging.getLogger(name=__name__)
 
+_document_image_cache = None
+
+
+def clear_document_image_cache():
+    global _document_image_cache
+
+    _document_image_cache = None
+
+
+def get_document_image_cache():
+    """
+    Return the document image cache instance. The instance is fetched
+    once per process and reused until the cache is saved or deleted in
+    this process. Changes made by other processes to the maximum size
+    are picked up by Cache.prune().
+    """
+    global _document_image_cache
+
+    if _document_image_cache is None:
+        Cache = apps.get_model(app_label='file_caching', model_name='Cache')
+        _document_image_cache = Cache.objects.get(
+            defined_storage_name=STORAGE_NAME_DOCUMENT_IMAGE
+        )
+
+    return _document_image_cache
+
 
 def get_language(language_code):
     language = getattr(
@@ -81,8 +81,11 @@ class Cache(models.Model):
     def prune(self):
         """
         Deletes files until the total size of the cache is below the allowed
-        maximum size of the cache.
+        maximum size of the cache. The maximum size is reloaded first as
+        it could have been changed since this instance was loaded.
         """
+        self.refresh_from_db(fields=('maximum_size',))
+
         while self.get_total_size() > self.maximum_size:
             self.get_files().earliest().delete()
 
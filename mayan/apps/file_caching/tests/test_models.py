@@ -2,6 +2,8 @@ import mock
 
 from mayan.apps.common.tests.base import BaseTestCase
 
+from ..models import Cache
+
 from .mixins import CacheTestMixin
 
 
@@ -17,6 +19,18 @@ class CacheModelTestCase(CacheTestMixin, BaseTestCase):
 
         self.assertNotEqual(cache_total_size, self.test_cache.get_total_size())
 
+    def test_cache_prune_stored_maximum_size(self):
+        self._create_test_cache()
+        self._create_test_cache_partition()
+        self._create_test_cache_partition_file()
+
+        # Change the maximum size without updating the loaded instance.
+        Cache.objects.filter(pk=self.test_cache.pk).update(maximum_size=1)
+
+        self.test_cache.prune()
+
+        self.assertEqual(self.test_cache.get_total_size(), 0)
+
     @mock.patch('django.core.files.File.close')
     def test_storage_file_close(self, mock_storage_file_close_method):
         self._create_test_cache()
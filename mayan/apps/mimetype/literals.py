@@ -0,0 +1,5 @@
+# Deliberate cap on the number of bytes passed to libmagic to avoid
+# reading whole files. It is lower than the default read limit of recent
+# libmagic versions, formats only identifiable past this offset may be
+# detected differently.
+MIMETYPE_READ_BUFFER_SIZE = 2 ** 20  # 1 Megabyte
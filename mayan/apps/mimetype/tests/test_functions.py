@@ -7,7 +7,12 @@ from mayan.apps.common.tests.base import BaseTestCase
 from mayan.apps.common.tests.literals import EXCLUDE_TEST_TAG
 from mayan.apps.documents.models import Document
 from mayan.apps.documents.tests.base import DocumentTestMixin
-from mayan.apps.documents.tests.literals import TEST_PDF_DOCUMENT_FILENAME
+from mayan.apps.documents.tests.literals import (
+    TEST_PDF_DOCUMENT_FILENAME, TEST_SMALL_DOCUMENT_MIMETYPE,
+    TEST_SMALL_DOCUMENT_PATH
+)
+
+from ..api import get_mimetype
 
 # This constant may need tweaking as document upload code path changes.
 # The value is targeted at making the document upload process fail exactly
@@ -37,3 +42,20 @@ class MIMETypeTestCase(DocumentTestMixin, BaseTestCase):
         self._upload_test_document()
 
         self.assertEqual(Document.objects.count(), 1)
+
+
+class GetMIMETypeTestCase(BaseTestCase):
+    def test_get_mimetype(self):
+        with open(TEST_SMALL_DOCUMENT_PATH, mode='rb') as file_object:
+            self.assertEqual(
+                get_mimetype(file_object=file_object),
+                (TEST_SMALL_DOCUMENT_MIMETYPE, 'binary')
+            )
+            self.assertEqual(file_object.tell(), 0)
+
+    def test_get_mimetype_only(self):
+        with open(TEST_SMALL_DOCUMENT_PATH, mode='rb') as file_object:
+            self.assertEqual(
+                get_mimetype(file_object=file_object, mimetype_only=True),
+                (TEST_SMALL_DOCUMENT_MIMETYPE, None)
+            )